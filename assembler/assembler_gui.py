@@ -15,12 +15,160 @@ Features:
 """
 
 import tkinter as tk
-from tkinter import ttk, scrolledtext, filedialog, messagebox
+from tkinter import ttk, scrolledtext
 import os
 import sys
+import hashlib
+import types
+from concurrent.futures import ThreadPoolExecutor
+
+# filedialog, messagebox and the assembler itself are imported where they are
+# first used, so the main window comes up without waiting on them
+
+# Example programs offered in the Examples menu
+_EXAMPLES = types.MappingProxyType({
+    'crypto': '''# Crypto Demo Program
+# ====================
+
+# Initialize
+        addi x1, x0, 5          # limit = 5
+        addi x2, x0, 0          # counter = 0
+        addi x3, x0, 1          # increment = 1
+
+# Loop 5 times
+loop:
+        add  x2, x2, x3         # counter++
+        bne  x1, x2, loop       # while counter != limit
+
+# Crypto operations
+        rng  x11                # x11 = random
+        rotl x12, x11, x3       # rotate left
+        rotr x13, x11, x3       # rotate right
+        xor  x14, x12, x13      # XOR mix
+
+# Store results
+        sw   x11, 0(x0)         # mem[0] = RNG
+        sw   x12, 4(x0)         # mem[4] = ROTL
+        sw   x13, 8(x0)         # mem[8] = ROTR
+        sw   x14, 12(x0)        # mem[12] = XOR
+
+# Store test value
+        addi x10, x0, 25
+        sw   x10, 100(x0)       # mem[100] = 25
+
+# End
+        halt
+''',
+    'fibonacci': '''# Fibonacci Sequence
+# ==================
+
+# Calculate first 10 Fibonacci numbers
+        addi x1, x0, 10       # N = 10
+
+# Initialize F(0) and F(1)
+        addi x2, x0, 0        # F(0) = 0
+        addi x3, x0, 1        # F(1) = 1
+
+# Store first two values
+        sw   x2, 0(x0)        # mem[0] = 0
+        sw   x3, 4(x0)        # mem[4] = 1
+
+# Loop setup
+        addi x4, x0, 2        # counter = 2
+        addi x5, x0, 8        # addr = 8
+
+# Main loop
+fib:
+        add  x6, x2, x3       # F(n) = F(n-2) + F(n-1)
+        sw   x6, 0(x5)        # store F(n)
+        add  x2, x0, x3       # shift values
+        add  x3, x0, x6
+        addi x4, x4, 1        # counter++
+        addi x5, x5, 4        # addr += 4
+        bne  x4, x1, fib      # loop
+
+        halt
+''',
+    'loop': '''# Simple Loop Example
+# ===================
+
+# Count from 1 to 10
+        addi x1, x0, 10       # limit = 10
+        addi x2, x0, 0        # sum = 0
+        addi x3, x0, 1        # i = 1
+
+loop:
+        add  x2, x2, x3       # sum += i
+        addi x3, x3, 1        # i++
+        bne  x3, x1, loop     # while i != limit
+
+# Result: x2 = 1+2+3+...+9 = 45
+        sw   x2, 0(x0)        # store sum
+
+        halt
+'''
+})
+
+# Text shown by Help > Instruction Reference
+_REFERENCE = """
+RISC-V INSTRUCTION REFERENCE
+=============================
+
+R-TYPE (Register-Register)
+--------------------------
+add  rd, rs1, rs2    # rd = rs1 + rs2
+sub  rd, rs1, rs2    # rd = rs1 - rs2
+and  rd, rs1, rs2    # rd = rs1 & rs2
+or   rd, rs1, rs2    # rd = rs1 | rs2
+xor  rd, rs1, rs2    # rd = rs1 ^ rs2
+sll  rd, rs1, rs2    # rd = rs1 << rs2
+srl  rd, rs1, rs2    # rd = rs1 >> rs2 (logical)
+sra  rd, rs1, rs2    # rd = rs1 >> rs2 (arithmetic)
+slt  rd, rs1, rs2    # rd = (rs1 < rs2) ? 1 : 0
+
+I-TYPE (Immediate)
+------------------
+addi rd, rs1, imm    # rd = rs1 + imm
+andi rd, rs1, imm    # rd = rs1 & imm
+ori  rd, rs1, imm    # rd = rs1 | imm
+xori rd, rs1, imm    # rd = rs1 ^ imm
+
+MEMORY
+------
+lw   rd, offset(rs1)    # Load word
+sw   rs2, offset(rs1)   # Store word
+
+BRANCHES
+--------
+beq  rs1, rs2, label    # Branch if equal
+bne  rs1, rs2, label    # Branch if not equal
+blt  rs1, rs2, label    # Branch if less than
+bge  rs1, rs2, label    # Branch if greater/equal
+
+JUMPS
+-----
+jal  rd, label          # Jump and link
+jalr rd, offset(rs1)    # Jump and link register
+
+CRYPTO EXTENSIONS
+-----------------
+rng  rd                 # rd = random number
+rotl rd, rs1, rs2       # rd = rotate left
+rotr rd, rs1, rs2       # rd = rotate right
+
+SYSTEM
+------
+halt                    # Stop execution
+
+REGISTERS
+---------
+x0/zero  - Always zero
+x1/ra    - Return address
+x2/sp    - Stack pointer
+x10-x17  - a0-a7 (arguments)
+x5-x7    - t0-t2 (temporaries)
+"""
 
-# Import the assembler
-from riscv_assembler import RISCVAssembler
 
 class RISCVAssemblerGUI:
     def __init__(self, root):
@@ -37,6 +185,22 @@ class RISCVAssemblerGUI:
         # Current file
         self.current_file = None
         
+        # Editor text as of the last fetch; refetched only after an edit
+        self._source = None
+        
+        # Last assembled program, keyed by a hash of its source text
+        self._cache: dict = {}
+        # (program, listing text) for the last program shown; the hex and
+        # Verilog text are memoized on the program itself
+        self._listing = (None, "")
+        
+        # Console messages queued by show_assembled(), see _flush_console()
+        self._console_buf = []
+        
+        # Assembly runs off the Tk thread; only the newest request is shown
+        self._pool = ThreadPoolExecutor(max_workers=1)
+        self._pending = None
+        
         # Create GUI
         self.create_menu()
         self.create_toolbar()
@@ -159,7 +323,7 @@ class RISCVAssemblerGUI:
         listing_frame = ttk.Frame(self.output_notebook)
         self.output_notebook.add(listing_frame, text="📋 Listing")
         
-        self.listing_text = scrolledtext.ScrolledText(
+        self.listing_text = self.create_output_text(
             listing_frame,
             wrap=tk.NONE,
             font=('Consolas', 10),
@@ -169,13 +333,12 @@ class RISCVAssemblerGUI:
             padx=10,
             pady=10
         )
-        self.listing_text.pack(fill=tk.BOTH, expand=True)
         
         # Tab 2: Hex Output
         hex_frame = ttk.Frame(self.output_notebook)
         self.output_notebook.add(hex_frame, text="🔢 Hex")
         
-        self.hex_text = scrolledtext.ScrolledText(
+        self.hex_text = self.create_output_text(
             hex_frame,
             wrap=tk.NONE,
             font=('Consolas', 10),
@@ -185,13 +348,12 @@ class RISCVAssemblerGUI:
             padx=10,
             pady=10
         )
-        self.hex_text.pack(fill=tk.BOTH, expand=True)
         
         # Tab 3: Verilog Output
         verilog_frame = ttk.Frame(self.output_notebook)
         self.output_notebook.add(verilog_frame, text="📟 Verilog")
         
-        self.verilog_text = scrolledtext.ScrolledText(
+        self.verilog_text = self.create_output_text(
             verilog_frame,
             wrap=tk.NONE,
             font=('Consolas', 10),
@@ -201,13 +363,12 @@ class RISCVAssemblerGUI:
             padx=10,
             pady=10
         )
-        self.verilog_text.pack(fill=tk.BOTH, expand=True)
         
         # Tab 4: Console/Errors
         console_frame = ttk.Frame(self.output_notebook)
         self.output_notebook.add(console_frame, text="🖥 Console")
         
-        self.console_text = scrolledtext.ScrolledText(
+        self.console_text = self.create_output_text(
             console_frame,
             wrap=tk.WORD,
             font=('Consolas', 10),
@@ -217,7 +378,30 @@ class RISCVAssemblerGUI:
             padx=10,
             pady=10
         )
-        self.console_text.pack(fill=tk.BOTH, expand=True)
+    
+    def create_output_text(self, parent, **options):
+        """Create a packed Text widget with a vertical scrollbar for an output tab"""
+        text = tk.Text(parent, **options)
+        scrollbar = ttk.Scrollbar(parent, orient=tk.VERTICAL, command=text.yview)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        text.configure(yscrollcommand=self._throttled_scroll(scrollbar))
+        return text
+    
+    def _throttled_scroll(self, scrollbar):
+        """Coalesce yscrollcommand updates so the scrollbar redraws at most ~60 Hz"""
+        latest = [None]
+        
+        def apply():
+            scrollbar.set(*latest[0])
+            latest[0] = None
+        
+        def yset(first, last):
+            if latest[0] is None:
+                self.root.after(16, apply)
+            latest[0] = (first, last)
+        
+        return yset
     
     def create_status_bar(self):
         """Create status bar"""
@@ -228,12 +412,21 @@ class RISCVAssemblerGUI:
                               relief=tk.SUNKEN, anchor=tk.W)
         status_bar.pack(fill=tk.X, side=tk.BOTTOM)
     
-    def log_console(self, message, clear=False):
-        """Log message to console"""
+    def _current_source(self):
+        """Return the editor text, copying it out of Tk only after an edit"""
+        if self._source is None or self.source_text.edit_modified():
+            self._source = self.source_text.get('1.0', 'end-1c')
+            self.source_text.edit_modified(False)
+        return self._source
+    
+    def _flush_console(self, clear=False):
+        """Write all buffered console messages in one widget update"""
         self.console_text.configure(state=tk.NORMAL)
         if clear:
             self.console_text.delete(1.0, tk.END)
-        self.console_text.insert(tk.END, message + "\n")
+        if self._console_buf:
+            self.console_text.insert(tk.END, "\n".join(self._console_buf) + "\n")
+            self._console_buf.clear()
         self.console_text.see(tk.END)
         self.console_text.configure(state=tk.DISABLED)
     
@@ -245,76 +438,118 @@ class RISCVAssemblerGUI:
         widget.configure(state=tk.DISABLED)
     
     def assemble(self):
-        """Assemble the source code"""
-        source = self.source_text.get(1.0, tk.END)
+        """Assemble the source code in the background"""
+        source = self._current_source()
         
-        self.log_console("=" * 60, clear=True)
-        self.log_console("RISC-V Assembler")
-        self.log_console("=" * 60)
+        # A request that has not started yet is superseded by this one
+        if self._pending is not None:
+            self._pending.cancel()
+        
+        self.status_var.set("Assembling…")
+        self._pending = self._pool.submit(self._get_assembled, source)
+        self.root.after(50, self._poll_assemble, self._pending)
+    
+    def _poll_assemble(self, future):
+        """Wait for a background assembly without blocking the event loop"""
+        if future is not self._pending:
+            return  # A newer assembly was requested meanwhile
+        if not future.done():
+            self.root.after(50, self._poll_assemble, future)
+            return
+        self._pending = None
+        self.show_assembled(future)
+    
+    def show_assembled(self, future):
+        """Show the result of a finished assembly"""
+        from tkinter import messagebox
+        
+        self._console_buf.extend(["=" * 60, "RISC-V Assembler", "=" * 60])
+        error_box = None
         
         try:
-            asm = RISCVAssembler()
-            asm.assemble(source)
+            asm = future.result()
             
             if asm.errors:
                 # Show errors
-                error_text = "ASSEMBLY ERRORS:\n" + "=" * 40 + "\n"
-                for error in asm.errors:
-                    error_text += f"  {error}\n"
+                parts = ["ASSEMBLY ERRORS:\n", "=" * 40, "\n"]
+                parts.extend(f"  {error}\n" for error in asm.errors)
+                error_text = "".join(parts)
                 self.set_output_text(self.listing_text, error_text)
-                self.log_console("❌ Assembly failed with errors")
-                self.status_var.set("Assembly failed - see errors")
+                self._console_buf.append("❌ Assembly failed with errors")
+                status = "Assembly failed - see errors"
                 self.output_notebook.select(3)  # Switch to console
-                messagebox.showerror("Assembly Error", f"{len(asm.errors)} error(s) found")
-                return
-            
-            # Generate listing
-            listing = self.generate_listing(asm)
-            self.set_output_text(self.listing_text, listing)
-            
-            # Generate hex
-            hex_output = asm.to_hex()
-            self.set_output_text(self.hex_text, hex_output)
-            
-            # Generate Verilog
-            verilog_output = asm.to_verilog()
-            self.set_output_text(self.verilog_text, verilog_output)
-            
-            # Log success
-            self.log_console(f"✅ Assembly successful!")
-            self.log_console(f"   Instructions: {len(asm.machine_code)}")
-            self.log_console(f"   Size: {len(asm.machine_code) * 4} bytes")
-            if asm.labels:
-                self.log_console(f"   Labels: {', '.join(asm.labels.keys())}")
-            
-            self.status_var.set(f"Assembly successful - {len(asm.machine_code)} instructions")
-            self.output_notebook.select(0)  # Switch to listing
+                error_box = ("Assembly Error", f"{len(asm.errors)} error(s) found")
+            else:
+                # Generate listing (once per assembled program)
+                if self._listing[0] is not asm:
+                    self._listing = (asm, self.generate_listing(asm))
+                self.set_output_text(self.listing_text, self._listing[1])
+                
+                # Generate hex
+                hex_output = asm.to_hex()
+                self.set_output_text(self.hex_text, hex_output)
+                
+                # Generate Verilog
+                verilog_output = asm.to_verilog()
+                self.set_output_text(self.verilog_text, verilog_output)
+                
+                # Log success
+                self._console_buf.append(f"✅ Assembly successful!")
+                self._console_buf.append(f"   Instructions: {len(asm.machine_code)}")
+                self._console_buf.append(f"   Size: {len(asm.machine_code) * 4} bytes")
+                if asm.labels:
+                    self._console_buf.append(f"   Labels: {', '.join(asm.labels.keys())}")
+                
+                status = f"Assembly successful - {len(asm.machine_code)} instructions"
+                self.output_notebook.select(0)  # Switch to listing
             
         except Exception as e:
-            self.log_console(f"❌ Error: {str(e)}")
-            self.status_var.set("Assembly failed")
-            messagebox.showerror("Error", str(e))
+            self._console_buf.append(f"❌ Error: {str(e)}")
+            status = "Assembly failed"
+            error_box = ("Error", str(e))
+        
+        # One console write and one status update, before any modal dialog
+        self._flush_console(clear=True)
+        self.status_var.set(status)
+        if error_box:
+            messagebox.showerror(*error_box)
+    
+    def _get_assembled(self, source):
+        """Assemble source, reusing the previous result if it is unchanged"""
+        key = hashlib.blake2b(source.encode(), digest_size=16).digest()
+        if key in self._cache:
+            return self._cache[key]
+        
+        from riscv_assembler import RISCVAssembler
+        asm = RISCVAssembler()
+        asm.assemble(source)
+        # Only the latest build is ever requested again
+        self._cache = {key: asm}
+        return asm
     
     def generate_listing(self, asm):
         """Generate assembly listing"""
-        lines = []
-        lines.append("=" * 70)
-        lines.append("RISC-V ASSEMBLY LISTING")
-        lines.append("=" * 70)
-        lines.append(f"{'ADDR':<10} {'MACHINE CODE':<14} {'ASSEMBLY':<40}")
-        lines.append("-" * 70)
-        
-        for code, (addr, instr, line_num) in zip(asm.machine_code, asm.instructions):
-            lines.append(f"0x{addr:04X}     0x{code:08X}     {instr}")
+        header = (
+            "=" * 70,
+            "RISC-V ASSEMBLY LISTING",
+            "=" * 70,
+            f"{'ADDR':<10} {'MACHINE CODE':<14} {'ASSEMBLY':<40}",
+            "-" * 70,
+        )
+        footer = (
+            "-" * 70,
+            f"Total: {len(asm.machine_code)} instructions ({len(asm.machine_code) * 4} bytes)",
+            "=" * 70,
+        )
         
-        lines.append("-" * 70)
-        lines.append(f"Total: {len(asm.machine_code)} instructions ({len(asm.machine_code) * 4} bytes)")
-        lines.append("=" * 70)
+        from riscv_assembler import LISTING_ROW
+        rows = [LISTING_ROW % row for row in zip(asm.addrs, asm.machine_code, asm.sources)]
+        lines = [*header, *rows, *footer]
         
         if asm.labels:
             lines.append("")
             lines.append("LABELS:")
-            for label, addr in asm.labels.items():
+            for label, addr in sorted(asm.labels.items(), key=lambda kv: kv[1]):
                 lines.append(f"  {label}: 0x{addr:04X}")
         
         return '\n'.join(lines)
@@ -328,6 +563,7 @@ class RISCVAssemblerGUI:
     
     def open_file(self):
         """Open file dialog"""
+        from tkinter import filedialog, messagebox
         filename = filedialog.askopenfilename(
             title="Open Assembly File",
             filetypes=[("Assembly files", "*.asm"), ("All files", "*.*")]
@@ -346,6 +582,7 @@ class RISCVAssemblerGUI:
     
     def save_file(self):
         """Save current file"""
+        from tkinter import messagebox
         if self.current_file:
             try:
                 with open(self.current_file, 'w') as f:
@@ -358,6 +595,7 @@ class RISCVAssemblerGUI:
     
     def save_file_as(self):
         """Save file as dialog"""
+        from tkinter import filedialog, messagebox
         filename = filedialog.asksaveasfilename(
             title="Save Assembly File",
             defaultextension=".asm",
@@ -375,11 +613,11 @@ class RISCVAssemblerGUI:
     
     def export_hex(self):
         """Export hex file"""
+        from tkinter import filedialog, messagebox
         # First assemble
-        source = self.source_text.get(1.0, tk.END)
+        source = self._current_source()
         try:
-            asm = RISCVAssembler()
-            asm.assemble(source)
+            asm = self._get_assembled(source)
             
             if asm.errors:
                 messagebox.showerror("Error", "Cannot export - assembly has errors")
@@ -400,10 +638,10 @@ class RISCVAssemblerGUI:
     
     def export_verilog(self):
         """Export Verilog file"""
-        source = self.source_text.get(1.0, tk.END)
+        from tkinter import filedialog, messagebox
+        source = self._current_source()
         try:
-            asm = RISCVAssembler()
-            asm.assemble(source)
+            asm = self._get_assembled(source)
             
             if asm.errors:
                 messagebox.showerror("Error", "Cannot export - assembly has errors")
@@ -424,10 +662,10 @@ class RISCVAssemblerGUI:
     
     def export_mem(self):
         """Export .mem file"""
-        source = self.source_text.get(1.0, tk.END)
+        from tkinter import filedialog, messagebox
+        source = self._current_source()
         try:
-            asm = RISCVAssembler()
-            asm.assemble(source)
+            asm = self._get_assembled(source)
             
             if asm.errors:
                 messagebox.showerror("Error", "Cannot export - assembly has errors")
@@ -448,92 +686,10 @@ class RISCVAssemblerGUI:
     
     def load_example(self, example_name):
         """Load example program"""
-        examples = {
-            'crypto': '''# Crypto Demo Program
-# ====================
-
-# Initialize
-        addi x1, x0, 5          # limit = 5
-        addi x2, x0, 0          # counter = 0
-        addi x3, x0, 1          # increment = 1
-
-# Loop 5 times
-loop:
-        add  x2, x2, x3         # counter++
-        bne  x1, x2, loop       # while counter != limit
-
-# Crypto operations
-        rng  x11                # x11 = random
-        rotl x12, x11, x3       # rotate left
-        rotr x13, x11, x3       # rotate right
-        xor  x14, x12, x13      # XOR mix
-
-# Store results
-        sw   x11, 0(x0)         # mem[0] = RNG
-        sw   x12, 4(x0)         # mem[4] = ROTL
-        sw   x13, 8(x0)         # mem[8] = ROTR
-        sw   x14, 12(x0)        # mem[12] = XOR
-
-# Store test value
-        addi x10, x0, 25
-        sw   x10, 100(x0)       # mem[100] = 25
-
-# End
-        halt
-''',
-            'fibonacci': '''# Fibonacci Sequence
-# ==================
-
-# Calculate first 10 Fibonacci numbers
-        addi x1, x0, 10       # N = 10
-
-# Initialize F(0) and F(1)
-        addi x2, x0, 0        # F(0) = 0
-        addi x3, x0, 1        # F(1) = 1
-
-# Store first two values
-        sw   x2, 0(x0)        # mem[0] = 0
-        sw   x3, 4(x0)        # mem[4] = 1
-
-# Loop setup
-        addi x4, x0, 2        # counter = 2
-        addi x5, x0, 8        # addr = 8
-
-# Main loop
-fib:
-        add  x6, x2, x3       # F(n) = F(n-2) + F(n-1)
-        sw   x6, 0(x5)        # store F(n)
-        add  x2, x0, x3       # shift values
-        add  x3, x0, x6
-        addi x4, x4, 1        # counter++
-        addi x5, x5, 4        # addr += 4
-        bne  x4, x1, fib      # loop
-
-        halt
-''',
-            'loop': '''# Simple Loop Example
-# ===================
-
-# Count from 1 to 10
-        addi x1, x0, 10       # limit = 10
-        addi x2, x0, 0        # sum = 0
-        addi x3, x0, 1        # i = 1
-
-loop:
-        add  x2, x2, x3       # sum += i
-        addi x3, x3, 1        # i++
-        bne  x3, x1, loop     # while i != limit
-
-# Result: x2 = 1+2+3+...+9 = 45
-        sw   x2, 0(x0)        # store sum
-
-        halt
-'''
-        }
-        
-        if example_name in examples:
+        text = _EXAMPLES.get(example_name)
+        if text:
             self.source_text.delete(1.0, tk.END)
-            self.source_text.insert(1.0, examples[example_name])
+            self.source_text.insert(1.0, text)
             self.current_file = None
             self.root.title(f"RISC-V Assembler - {example_name}.asm")
             self.status_var.set(f"Loaded example: {example_name}")
@@ -560,69 +716,12 @@ loop:
         )
         text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        reference = """
-RISC-V INSTRUCTION REFERENCE
-=============================
-
-R-TYPE (Register-Register)
---------------------------
-add  rd, rs1, rs2    # rd = rs1 + rs2
-sub  rd, rs1, rs2    # rd = rs1 - rs2
-and  rd, rs1, rs2    # rd = rs1 & rs2
-or   rd, rs1, rs2    # rd = rs1 | rs2
-xor  rd, rs1, rs2    # rd = rs1 ^ rs2
-sll  rd, rs1, rs2    # rd = rs1 << rs2
-srl  rd, rs1, rs2    # rd = rs1 >> rs2 (logical)
-sra  rd, rs1, rs2    # rd = rs1 >> rs2 (arithmetic)
-slt  rd, rs1, rs2    # rd = (rs1 < rs2) ? 1 : 0
-
-I-TYPE (Immediate)
-------------------
-addi rd, rs1, imm    # rd = rs1 + imm
-andi rd, rs1, imm    # rd = rs1 & imm
-ori  rd, rs1, imm    # rd = rs1 | imm
-xori rd, rs1, imm    # rd = rs1 ^ imm
-
-MEMORY
-------
-lw   rd, offset(rs1)    # Load word
-sw   rs2, offset(rs1)   # Store word
-
-BRANCHES
---------
-beq  rs1, rs2, label    # Branch if equal
-bne  rs1, rs2, label    # Branch if not equal
-blt  rs1, rs2, label    # Branch if less than
-bge  rs1, rs2, label    # Branch if greater/equal
-
-JUMPS
------
-jal  rd, label          # Jump and link
-jalr rd, offset(rs1)    # Jump and link register
-
-CRYPTO EXTENSIONS
------------------
-rng  rd                 # rd = random number
-rotl rd, rs1, rs2       # rd = rotate left
-rotr rd, rs1, rs2       # rd = rotate right
-
-SYSTEM
-------
-halt                    # Stop execution
-
-REGISTERS
----------
-x0/zero  - Always zero
-x1/ra    - Return address
-x2/sp    - Stack pointer
-x10-x17  - a0-a7 (arguments)
-x5-x7    - t0-t2 (temporaries)
-"""
-        text.insert(1.0, reference)
+        text.insert(1.0, _REFERENCE)
         text.configure(state=tk.DISABLED)
     
     def show_about(self):
         """Show about dialog"""
+        from tkinter import messagebox
         messagebox.showinfo("About", 
             "RISC-V Assembler GUI\n"
             "Version 1.0\n\n"
@@ -28,8 +28,8 @@ Output:
 """
 
 import sys
-import re
-import argparse
+import functools
+from array import array
 from typing import Dict, List, Tuple, Optional
 
 # ==============================================================================
@@ -158,370 +158,448 @@ FUNCT7 = {
     'rotl': 0b0000000, 'rotr': 0b0000000, 'rng': 0b0000000,
 }
 
+# ==============================================================================
+# INSTRUCTION TABLE: mnemonic -> (opcode, funct3, funct7)
+# ==============================================================================
+INSTR_TABLE = {
+    instr: (OPCODES[instr], FUNCT3.get(instr, 0), FUNCT7.get(instr, 0))
+    for instr in OPCODES
+}
+
+# Fixed bits of each instruction: funct7 | funct3 | opcode
+BASE = {
+    instr: (funct7 << 25) | (funct3 << 12) | opcode
+    for instr, (opcode, funct3, funct7) in INSTR_TABLE.items()
+}
+
+# Instructions whose encoding never depends on operands
+CONST_ENCODING = {
+    'nop': 0x00000013,    # addi x0, x0, 0
+    'halt': 0x00000073,   # ecall
+    'ecall': 0x00000073,
+}
+
+
+# ==============================================================================
+# IMMEDIATE SCRAMBLING
+# ==============================================================================
+def encode_branch_imm(imm: int) -> int:
+    """Place a B-type offset in its instruction bits: imm[12|10:5] ... imm[4:1|11]"""
+    return ((imm & 0x1000) << 19) | ((imm & 0x7E0) << 20) | \
+           ((imm & 0x1E) << 7) | ((imm & 0x800) >> 4)
+
+
+def encode_jump_imm(imm: int) -> int:
+    """Place a J-type offset in its instruction bits: imm[20|10:1|11|19:12]"""
+    return ((imm & 0x100000) << 11) | ((imm & 0x7FE) << 20) | \
+           ((imm & 0x800) << 9) | (imm & 0xFF000)
+
+
+# ==============================================================================
+# OPERAND PARSING
+# ==============================================================================
+@functools.lru_cache(maxsize=None)
+def parse_register(reg_str: str) -> int:
+    """Parse register name to number (memoized; the name space is tiny)"""
+    reg_str = reg_str.strip().lower().replace(',', '')
+    if reg_str in REGISTERS:
+        return REGISTERS[reg_str]
+    raise ValueError(f"Unknown register: {reg_str}")
+
+
+def parse_int(imm_str: str) -> int:
+    """Convert a hex (0x), binary (0b) or decimal literal; ValueError if it is not one"""
+    imm_str = imm_str.strip().replace(',', '')
+    
+    # Handle hex, binary, or decimal
+    if imm_str.startswith('0x') or imm_str.startswith('0X'):
+        return int(imm_str, 16)
+    elif imm_str.startswith('0b') or imm_str.startswith('0B'):
+        return int(imm_str, 2)
+    return int(imm_str)
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_immediate(imm_str: str, bits: int = 12, signed: bool = True) -> int:
+    """Parse immediate value with bounds checking (memoized per literal)"""
+    value = parse_int(imm_str)
+    
+    # Check bounds
+    if signed:
+        min_val = -(1 << (bits - 1))
+        max_val = (1 << (bits - 1)) - 1
+    else:
+        min_val = 0
+        max_val = (1 << bits) - 1
+    
+    if value < min_val or value > max_val:
+        raise ValueError(f"Immediate {value} out of range [{min_val}, {max_val}]")
+    
+    # Convert to unsigned for encoding (no-op for in-range positive values)
+    return value & ((1 << bits) - 1)
+
+
+# Per-instruction output rows, shared by every emitter so the formats cannot drift
+HEX_ROW = '0x%08X: 0x%08X  // %s'                                  # addr, code, asm
+MEM_ROW = '%08X'                                                   # code
+VERILOG_ROW = "        I_MEM_BLOCK[%d]  = 32'h%08X;  // 0x%02X: %s"  # index, code, addr, asm
+LISTING_ROW = '0x%04X     0x%08X     %s'                           # addr, code, asm
+
 
 class RISCVAssembler:
     """RISC-V Assembler for Single Cycle Processor"""
     
     def __init__(self):
+        # Format handlers bound to this instance, indexed by MNEMONIC_ID
+        self._handlers = tuple(getattr(self, handler.__name__) for handler in _ENCODERS.values())
+        self.reset()
+    
+    def reset(self):
+        """Clear state left over from a previous assemble() call"""
         self.labels: Dict[str, int] = {}
-        self.instructions: List[Tuple[int, str, int]] = []  # (address, line, line_num)
-        self.machine_code: List[int] = []
+        
+        # One row per encoded instruction, stored column-wise
+        self.addrs = array('I')
+        self.machine_code = array('I')  # packed uint32 words
+        self.sources: List[str] = []
+        self.linenos: List[int] = []
+        
+        self.fixups: List[Tuple[int, str, str, int]] = []  # (index, label, 'b'/'j', address)
         self.current_address = 0
         self.errors: List[str] = []
         
+        # Drop output text memoized by to_hex() / to_verilog() / to_mem()
+        for name in ('_hex_text', '_verilog_text', '_mem_text'):
+            self.__dict__.pop(name, None)
+        
     def parse_register(self, reg_str: str) -> int:
         """Parse register name to number"""
-        reg_str = reg_str.strip().lower().replace(',', '')
-        if reg_str in REGISTERS:
-            return REGISTERS[reg_str]
-        raise ValueError(f"Unknown register: {reg_str}")
+        return parse_register(reg_str)
     
     def parse_immediate(self, imm_str: str, bits: int = 12, signed: bool = True) -> int:
         """Parse immediate value with bounds checking"""
-        imm_str = imm_str.strip().replace(',', '')
-        
-        # Handle hex, binary, or decimal
-        if imm_str.startswith('0x') or imm_str.startswith('0X'):
-            value = int(imm_str, 16)
-        elif imm_str.startswith('0b') or imm_str.startswith('0B'):
-            value = int(imm_str, 2)
-        else:
-            value = int(imm_str)
-        
-        # Check bounds
-        if signed:
-            min_val = -(1 << (bits - 1))
-            max_val = (1 << (bits - 1)) - 1
-        else:
-            min_val = 0
-            max_val = (1 << bits) - 1
-            
-        if value < min_val or value > max_val:
-            raise ValueError(f"Immediate {value} out of range [{min_val}, {max_val}]")
-        
-        # Convert to unsigned for encoding
-        if value < 0:
-            value = value & ((1 << bits) - 1)
-            
-        return value
+        return parse_immediate(imm_str, bits, signed)
     
     def parse_memory_operand(self, operand: str) -> Tuple[int, int]:
         """Parse memory operand like '100(x0)' -> (offset, base_reg)"""
-        match = re.match(r'(-?\d+)\s*\(\s*(\w+)\s*\)', operand.strip())
-        if not match:
+        text = operand.strip()
+        lparen = text.find('(')
+        rparen = text.find(')', lparen + 1)
+        
+        # Decimal offset, then a word-character base register in parentheses
+        offset_str = text[:lparen].rstrip()
+        digits = offset_str[1:] if offset_str[:1] == '-' else offset_str
+        base_str = text[lparen + 1:rparen].strip()
+        if lparen < 0 or rparen < 0 or not digits.isdecimal() or \
+                not base_str.replace('_', 'a').isalnum():
             raise ValueError(f"Invalid memory operand: {operand}")
         
-        offset = self.parse_immediate(match.group(1))
-        base_reg = self.parse_register(match.group(2))
+        offset = self.parse_immediate(offset_str)
+        base_reg = self.parse_register(base_str)
         return offset, base_reg
     
     # ==========================================================================
-    # INSTRUCTION ENCODERS
-    # ==========================================================================
-    
-    def encode_r_type(self, instr: str, rd: int, rs1: int, rs2: int) -> int:
-        """Encode R-type instruction"""
-        opcode = OPCODES[instr]
-        funct3 = FUNCT3[instr]
-        funct7 = FUNCT7[instr]
-        
-        return (funct7 << 25) | (rs2 << 20) | (rs1 << 15) | (funct3 << 12) | (rd << 7) | opcode
-    
-    def encode_i_type(self, instr: str, rd: int, rs1: int, imm: int) -> int:
-        """Encode I-type instruction"""
-        opcode = OPCODES[instr]
-        funct3 = FUNCT3[instr]
-        
-        # Handle shift instructions (imm is shamt, funct7 in upper bits)
-        if instr in ['slli', 'srli', 'srai']:
-            funct7 = FUNCT7[instr]
-            imm = (funct7 << 5) | (imm & 0x1F)
-        
-        return ((imm & 0xFFF) << 20) | (rs1 << 15) | (funct3 << 12) | (rd << 7) | opcode
-    
-    def encode_s_type(self, instr: str, rs2: int, rs1: int, imm: int) -> int:
-        """Encode S-type instruction (stores)"""
-        opcode = OPCODES[instr]
-        funct3 = FUNCT3[instr]
-        
-        imm_11_5 = (imm >> 5) & 0x7F
-        imm_4_0 = imm & 0x1F
-        
-        return (imm_11_5 << 25) | (rs2 << 20) | (rs1 << 15) | (funct3 << 12) | (imm_4_0 << 7) | opcode
-    
-    def encode_b_type(self, instr: str, rs1: int, rs2: int, imm: int) -> int:
-        """Encode B-type instruction (branches)"""
-        opcode = OPCODES[instr]
-        funct3 = FUNCT3[instr]
-        
-        # B-type immediate encoding: imm[12|10:5|4:1|11]
-        imm_12 = (imm >> 12) & 0x1
-        imm_11 = (imm >> 11) & 0x1
-        imm_10_5 = (imm >> 5) & 0x3F
-        imm_4_1 = (imm >> 1) & 0xF
-        
-        return (imm_12 << 31) | (imm_10_5 << 25) | (rs2 << 20) | (rs1 << 15) | \
-               (funct3 << 12) | (imm_4_1 << 8) | (imm_11 << 7) | opcode
-    
-    def encode_u_type(self, instr: str, rd: int, imm: int) -> int:
-        """Encode U-type instruction (LUI, AUIPC)"""
-        opcode = OPCODES[instr]
-        return ((imm & 0xFFFFF) << 12) | (rd << 7) | opcode
-    
-    def encode_j_type(self, instr: str, rd: int, imm: int) -> int:
-        """Encode J-type instruction (JAL)"""
-        opcode = OPCODES[instr]
-        
-        # J-type immediate encoding: imm[20|10:1|11|19:12]
-        imm_20 = (imm >> 20) & 0x1
-        imm_19_12 = (imm >> 12) & 0xFF
-        imm_11 = (imm >> 11) & 0x1
-        imm_10_1 = (imm >> 1) & 0x3FF
-        
-        return (imm_20 << 31) | (imm_10_1 << 21) | (imm_11 << 20) | \
-               (imm_19_12 << 12) | (rd << 7) | opcode
-    
-    def encode_crypto(self, instr: str, rd: int, rs1: int = 0, rs2: int = 0) -> int:
-        """Encode custom crypto instruction"""
-        opcode = OPCODES[instr]
-        funct3 = FUNCT3[instr]
-        funct7 = FUNCT7[instr]
-        
-        return (funct7 << 25) | (rs2 << 20) | (rs1 << 15) | (funct3 << 12) | (rd << 7) | opcode
-    
-    # ==========================================================================
-    # FIRST PASS: Collect Labels
+    # SINGLE PASS: Collect Labels and Generate Machine Code
     # ==========================================================================
     
-    def first_pass(self, lines: List[str]):
-        """First pass: collect all labels and their addresses"""
+    def single_pass(self, lines: List[str]):
+        """Collect labels and encode every line in one walk over the source"""
         self.current_address = 0
         
+        # Bound once: the loop body is the hot path on large sources
+        add_addr = self.addrs.append
+        add_code = self.machine_code.append
+        add_source = self.sources.append
+        add_lineno = self.linenos.append
+        
         for line_num, line in enumerate(lines, 1):
-            # Remove comments
-            line = re.sub(r'[#;].*', '', line).strip()
-            if not line:
+            # Blank and comment-only lines need no further scanning
+            line = line.strip()
+            if not line or line[0] in '#;':
                 continue
             
+            # Cut the trailing comment, then split off an optional 'label:'
+            cut = line.find('#')
+            if cut >= 0:
+                line = line[:cut]
+            cut = line.find(';')
+            if cut >= 0:
+                line = line[:cut]
+            label, colon, body = line.partition(':')
+            
             # Check for label
-            if ':' in line:
-                parts = line.split(':', 1)
-                label = parts[0].strip()
-                self.labels[label] = self.current_address
-                line = parts[1].strip() if len(parts) > 1 else ''
+            if colon:
+                # Interned so later branch/jump lookups hash cheaply
+                self.labels[sys.intern(label.strip())] = self.current_address
+                line = body.strip()
+            else:
+                line = line.strip()
+            
+            if not line:
+                continue
+            
+            addr = self.current_address
+            self.current_address += 4
             
-            if line:
-                self.instructions.append((self.current_address, line, line_num))
-                self.current_address += 4
-    
-    # ==========================================================================
-    # SECOND PASS: Generate Machine Code
-    # ==========================================================================
-    
-    def second_pass(self):
-        """Second pass: generate machine code"""
-        for addr, line, line_num in self.instructions:
             try:
-                code = self.assemble_instruction(line, addr)
-                self.machine_code.append(code)
+                code, pc_relative = encode_line(line)
+                if pc_relative:
+                    # tokenize() is memoized, so this reuses encode_line's split
+                    mid, parts = tokenize(line)
+                    code = self.encode_tokens(mid, parts, addr)
+                add_addr(addr)
+                add_code(code)
+                add_source(line)
+                add_lineno(line_num)
             except Exception as e:
                 self.errors.append(f"Line {line_num}: {e} - '{line}'")
+        
+        self.apply_fixups()
+    
+    def target_offset(self, target: str, current_addr: int, kind: str) -> int:
+        """Resolve a branch ('b') or jump ('j') target to a PC-relative offset
+        
+        A target that is neither a known label nor a numeric literal is taken
+        as a label defined further down: it is recorded in self.fixups and
+        encoded as 0 for now; apply_fixups() patches it in after the pass.
+        """
+        label_addr = self.labels.get(target)
+        if label_addr is not None:
+            return label_addr - current_addr
+        try:
+            parse_int(target)
+        except ValueError:
+            # The caller appends this instruction to machine_code next
+            self.fixups.append((len(self.machine_code), target, kind, current_addr))
+            return 0
+        return self.parse_immediate(target, bits=13 if kind == 'b' else 21, signed=True)
+    
+    def apply_fixups(self):
+        """Patch forward branch/jump offsets now that every label is known"""
+        undefined = False
+        for index, label, kind, addr in self.fixups:
+            if label not in self.labels:
+                self.errors.append(f"Line {self.linenos[index]}: Undefined label: {label}"
+                                   f" - '{self.sources[index]}'")
+                undefined = True
+                continue
+            
+            offset = self.labels[label] - addr
+            imm = encode_branch_imm(offset) if kind == 'b' else encode_jump_imm(offset)
+            self.machine_code[index] |= imm
+        
+        # These are only known after the pass; put them back in line order
+        # (stable, so errors on the same line keep their relative order)
+        if undefined:
+            self.errors.sort(key=lambda error: int(error[5:error.index(':')]))
     
     def assemble_instruction(self, line: str, current_addr: int) -> int:
         """Assemble a single instruction"""
-        parts = line.replace(',', ' ').split()
-        instr = parts[0].lower()
-        
-        # Handle pseudo-instructions
-        if instr == 'nop':
-            return self.encode_i_type('addi', 0, 0, 0)
-        
-        if instr == 'li':  # Load immediate (pseudo)
-            rd = self.parse_register(parts[1])
-            imm = self.parse_immediate(parts[2], bits=12)
-            return self.encode_i_type('addi', rd, 0, imm)
-        
-        if instr == 'mv':  # Move (pseudo)
-            rd = self.parse_register(parts[1])
-            rs = self.parse_register(parts[2])
-            return self.encode_i_type('addi', rd, rs, 0)
-        
-        if instr == 'j':  # Jump (pseudo for jal x0, offset)
-            if parts[1] in self.labels:
-                offset = self.labels[parts[1]] - current_addr
-            else:
-                offset = self.parse_immediate(parts[1], bits=21, signed=True)
-            return self.encode_j_type('jal', 0, offset)
-        
-        # R-type instructions
-        if instr in ['add', 'sub', 'and', 'or', 'xor', 'sll', 'srl', 'sra', 'slt', 'sltu']:
-            rd = self.parse_register(parts[1])
-            rs1 = self.parse_register(parts[2])
-            rs2 = self.parse_register(parts[3])
-            return self.encode_r_type(instr, rd, rs1, rs2)
-        
-        # I-type ALU
-        if instr in ['addi', 'andi', 'ori', 'xori', 'slti', 'sltiu']:
-            rd = self.parse_register(parts[1])
-            rs1 = self.parse_register(parts[2])
-            imm = self.parse_immediate(parts[3])
-            return self.encode_i_type(instr, rd, rs1, imm)
-        
-        # Shift immediate
-        if instr in ['slli', 'srli', 'srai']:
-            rd = self.parse_register(parts[1])
-            rs1 = self.parse_register(parts[2])
-            shamt = self.parse_immediate(parts[3], bits=5, signed=False)
-            return self.encode_i_type(instr, rd, rs1, shamt)
-        
-        # Load instructions
-        if instr in ['lw', 'lh', 'lb', 'lhu', 'lbu']:
-            rd = self.parse_register(parts[1])
-            offset, base = self.parse_memory_operand(parts[2])
-            return self.encode_i_type(instr, rd, base, offset)
-        
-        # Store instructions
-        if instr in ['sw', 'sh', 'sb']:
-            rs2 = self.parse_register(parts[1])
-            offset, base = self.parse_memory_operand(parts[2])
-            return self.encode_s_type(instr, rs2, base, offset)
-        
-        # Branch instructions
-        if instr in ['beq', 'bne', 'blt', 'bge', 'bltu', 'bgeu']:
-            rs1 = self.parse_register(parts[1])
-            rs2 = self.parse_register(parts[2])
-            if parts[3] in self.labels:
-                offset = self.labels[parts[3]] - current_addr
-            else:
-                offset = self.parse_immediate(parts[3], bits=13, signed=True)
-            return self.encode_b_type(instr, rs1, rs2, offset)
-        
-        # JAL
-        if instr == 'jal':
-            rd = self.parse_register(parts[1])
-            if parts[2] in self.labels:
-                offset = self.labels[parts[2]] - current_addr
-            else:
-                offset = self.parse_immediate(parts[2], bits=21, signed=True)
-            return self.encode_j_type(instr, rd, offset)
-        
-        # JALR
-        if instr == 'jalr':
-            rd = self.parse_register(parts[1])
-            if '(' in parts[2]:
-                offset, rs1 = self.parse_memory_operand(parts[2])
-            else:
-                rs1 = self.parse_register(parts[2])
-                offset = self.parse_immediate(parts[3]) if len(parts) > 3 else 0
-            return self.encode_i_type(instr, rd, rs1, offset)
-        
-        # LUI
-        if instr == 'lui':
-            rd = self.parse_register(parts[1])
-            imm = self.parse_immediate(parts[2], bits=20, signed=False)
-            return self.encode_u_type(instr, rd, imm)
-        
-        # AUIPC
-        if instr == 'auipc':
-            rd = self.parse_register(parts[1])
-            imm = self.parse_immediate(parts[2], bits=20, signed=False)
-            return self.encode_u_type(instr, rd, imm)
-        
-        # HALT / ECALL
-        if instr in ['halt', 'ecall']:
-            return 0x00000073
-        
-        # Custom Crypto: RNG
-        if instr == 'rng':
-            rd = self.parse_register(parts[1])
-            return self.encode_crypto(instr, rd, 0, 0)
-        
-        # Custom Crypto: ROTL
-        if instr == 'rotl':
-            rd = self.parse_register(parts[1])
-            rs1 = self.parse_register(parts[2])
-            rs2 = self.parse_register(parts[3])
-            return self.encode_crypto(instr, rd, rs1, rs2)
+        mid, parts = tokenize(line)
+        return self.encode_tokens(mid, parts, current_addr)
+    
+    def encode_tokens(self, mid: Optional[int], parts: Tuple[str, ...], current_addr: int) -> int:
+        """Encode a tokenize() result: mnemonic id and (mnemonic, operands...)"""
+        if mid is not None:
+            return self._handlers[mid](parts[0], parts, current_addr)
         
-        # Custom Crypto: ROTR
-        if instr == 'rotr':
-            rd = self.parse_register(parts[1])
+        # Fixed encodings need no operand parsing
+        code = CONST_ENCODING.get(parts[0])
+        if code is None:
+            raise ValueError(f"Unknown instruction: {parts[0]}")
+        return code
+    
+    # ==========================================================================
+    # FORMAT HANDLERS: parse operands for one instruction format and encode
+    # ==========================================================================
+    # Each handler builds its word inline as BASE[instr] | operand fields
+    
+    def _li(self, instr: str, parts: Tuple[str, ...], current_addr: int) -> int:
+        """li rd, imm (pseudo for addi rd, x0, imm)"""
+        rd = self.parse_register(parts[1])
+        imm = self.parse_immediate(parts[2], bits=12)
+        return BASE['addi'] | ((imm & 0xFFF) << 20) | (rd << 7)
+    
+    def _mv(self, instr: str, parts: Tuple[str, ...], current_addr: int) -> int:
+        """mv rd, rs (pseudo for addi rd, rs, 0)"""
+        rd = self.parse_register(parts[1])
+        rs = self.parse_register(parts[2])
+        return BASE['addi'] | (rs << 15) | (rd << 7)
+    
+    def _j(self, instr: str, parts: Tuple[str, ...], current_addr: int) -> int:
+        """j label_or_offset (pseudo for jal x0, offset)"""
+        offset = self.target_offset(parts[1], current_addr, 'j')
+        return BASE['jal'] | encode_jump_imm(offset)
+    
+    def _r_type(self, instr: str, parts: Tuple[str, ...], current_addr: int) -> int:
+        """add/sub/... rd, rs1, rs2"""
+        rd = self.parse_register(parts[1])
+        rs1 = self.parse_register(parts[2])
+        rs2 = self.parse_register(parts[3])
+        return BASE[instr] | (rs2 << 20) | (rs1 << 15) | (rd << 7)
+    
+    def _i_alu(self, instr: str, parts: Tuple[str, ...], current_addr: int) -> int:
+        """addi/andi/... rd, rs1, imm"""
+        rd = self.parse_register(parts[1])
+        rs1 = self.parse_register(parts[2])
+        imm = self.parse_immediate(parts[3])
+        return BASE[instr] | ((imm & 0xFFF) << 20) | (rs1 << 15) | (rd << 7)
+    
+    def _i_shift(self, instr: str, parts: Tuple[str, ...], current_addr: int) -> int:
+        """slli/srli/srai rd, rs1, shamt"""
+        rd = self.parse_register(parts[1])
+        rs1 = self.parse_register(parts[2])
+        shamt = self.parse_immediate(parts[3], bits=5, signed=False)
+        return BASE[instr] | ((shamt & 0x1F) << 20) | (rs1 << 15) | (rd << 7)
+    
+    def _load(self, instr: str, parts: Tuple[str, ...], current_addr: int) -> int:
+        """lw/lh/... rd, offset(rs1)"""
+        rd = self.parse_register(parts[1])
+        offset, base = self.parse_memory_operand(parts[2])
+        return BASE[instr] | ((offset & 0xFFF) << 20) | (base << 15) | (rd << 7)
+    
+    def _store(self, instr: str, parts: Tuple[str, ...], current_addr: int) -> int:
+        """sw/sh/sb rs2, offset(rs1)"""
+        rs2 = self.parse_register(parts[1])
+        offset, base = self.parse_memory_operand(parts[2])
+        return BASE[instr] | (((offset >> 5) & 0x7F) << 25) | (rs2 << 20) | (base << 15) | \
+               ((offset & 0x1F) << 7)
+    
+    def _branch(self, instr: str, parts: Tuple[str, ...], current_addr: int) -> int:
+        """beq/bne/... rs1, rs2, label_or_offset"""
+        rs1 = self.parse_register(parts[1])
+        rs2 = self.parse_register(parts[2])
+        offset = self.target_offset(parts[3], current_addr, 'b')
+        return BASE[instr] | encode_branch_imm(offset) | (rs2 << 20) | (rs1 << 15)
+    
+    def _jal(self, instr: str, parts: Tuple[str, ...], current_addr: int) -> int:
+        """jal rd, label_or_offset"""
+        rd = self.parse_register(parts[1])
+        offset = self.target_offset(parts[2], current_addr, 'j')
+        return BASE[instr] | encode_jump_imm(offset) | (rd << 7)
+    
+    def _jalr(self, instr: str, parts: Tuple[str, ...], current_addr: int) -> int:
+        """jalr rd, offset(rs1) | jalr rd, rs1[, offset]"""
+        rd = self.parse_register(parts[1])
+        if '(' in parts[2]:
+            offset, rs1 = self.parse_memory_operand(parts[2])
+        else:
             rs1 = self.parse_register(parts[2])
-            rs2 = self.parse_register(parts[3])
-            return self.encode_crypto(instr, rd, rs1, rs2)
-        
-        raise ValueError(f"Unknown instruction: {instr}")
+            offset = self.parse_immediate(parts[3]) if len(parts) > 3 else 0
+        return BASE[instr] | ((offset & 0xFFF) << 20) | (rs1 << 15) | (rd << 7)
+    
+    def _u_type(self, instr: str, parts: Tuple[str, ...], current_addr: int) -> int:
+        """lui/auipc rd, imm"""
+        rd = self.parse_register(parts[1])
+        imm = self.parse_immediate(parts[2], bits=20, signed=False)
+        return BASE[instr] | ((imm & 0xFFFFF) << 12) | (rd << 7)
+    
+    def _rng(self, instr: str, parts: Tuple[str, ...], current_addr: int) -> int:
+        """rng rd"""
+        rd = self.parse_register(parts[1])
+        return BASE[instr] | (rd << 7)
+    
+    def _rotate(self, instr: str, parts: Tuple[str, ...], current_addr: int) -> int:
+        """rotl/rotr rd, rs1, rs2"""
+        rd = self.parse_register(parts[1])
+        rs1 = self.parse_register(parts[2])
+        rs2 = self.parse_register(parts[3])
+        return BASE[instr] | (rs2 << 20) | (rs1 << 15) | (rd << 7)
     
     # ==========================================================================
     # ASSEMBLER MAIN
     # ==========================================================================
     
-    def assemble(self, source: str) -> List[int]:
+    def assemble(self, source: str) -> array:
         """Assemble source code to machine code"""
+        self.reset()
         lines = source.split('\n')
         
-        # First pass: collect labels
-        self.first_pass(lines)
-        
-        # Second pass: generate machine code
-        self.second_pass()
-        
-        if self.errors:
-            print("=" * 60)
-            print("ASSEMBLY ERRORS:")
-            print("=" * 60)
-            for error in self.errors:
-                print(f"  {error}")
-            print("=" * 60)
-            sys.exit(1)
+        # Labels and machine code in one pass; forward targets back-patched
+        self.single_pass(lines)
         
         return self.machine_code
     
+    def print_errors(self):
+        """Print collected assembly errors"""
+        print("=" * 60)
+        print("ASSEMBLY ERRORS:")
+        print("=" * 60)
+        for error in self.errors:
+            print(f"  {error}")
+        print("=" * 60)
+    
     # ==========================================================================
     # OUTPUT GENERATORS
     # ==========================================================================
     
     def to_hex(self) -> str:
         """Generate hex file content"""
-        lines = []
-        lines.append("// RISC-V Machine Code - Generated by riscv_assembler.py")
-        lines.append(f"// Total instructions: {len(self.machine_code)}")
-        lines.append("// Format: ADDRESS: MACHINE_CODE  // ASM")
-        lines.append("")
-        
-        for i, (code, (addr, asm, _)) in enumerate(zip(self.machine_code, self.instructions)):
-            lines.append(f"0x{addr:08X}: 0x{code:08X}  // {asm}")
-        
-        return '\n'.join(lines)
+        return self._hex_text
     
     def to_verilog(self) -> str:
         """Generate Verilog memory initialization"""
-        lines = []
-        lines.append("// =============================================================================")
-        lines.append("// RISC-V Instruction Memory - Auto-generated by riscv_assembler.py")
-        lines.append("// =============================================================================")
-        lines.append("")
-        lines.append("    initial begin")
-        
-        for i, (code, (addr, asm, _)) in enumerate(zip(self.machine_code, self.instructions)):
-            lines.append(f"        I_MEM_BLOCK[{i}]  = 32'h{code:08X};  // 0x{addr:02X}: {asm}")
-        
-        # Fill remaining with NOPs
-        lines.append("")
-        lines.append("        // Fill remaining with NOPs")
-        for i in range(len(self.machine_code), min(len(self.machine_code) + 5, 64)):
-            lines.append(f"        I_MEM_BLOCK[{i}] = 32'h00000013;  // nop")
-        
-        lines.append("    end")
-        
-        return '\n'.join(lines)
+        return self._verilog_text
     
     def to_mem(self) -> str:
         """Generate .mem file for $readmemh"""
-        lines = []
-        for code in self.machine_code:
-            lines.append(f"{code:08X}")
-        return '\n'.join(lines)
+        return self._mem_text
+    
+    def emit_all(self) -> Tuple[str, str, str]:
+        """Generate (hex, mem, verilog) text in a single walk over the instructions"""
+        if '_hex_text' not in self.__dict__:
+            hex_rows, mem_rows, verilog_rows = [], [], []
+            add_hex, add_mem, add_verilog = hex_rows.append, mem_rows.append, verilog_rows.append
+            for i, (addr, code, asm) in enumerate(zip(self.addrs, self.machine_code, self.sources)):
+                add_hex(HEX_ROW % (addr, code, asm))
+                add_mem(MEM_ROW % code)
+                add_verilog(VERILOG_ROW % (i, code, addr, asm))
+            
+            # Seed the per-format caches so to_hex() etc. reuse this walk
+            self.__dict__.update(_hex_text=self._hex_document(hex_rows),
+                                 _mem_text='\n'.join(mem_rows),
+                                 _verilog_text=self._verilog_document(verilog_rows))
+        return self._hex_text, self._mem_text, self._verilog_text
+    
+    @functools.cached_property
+    def _hex_text(self) -> str:
+        return self._hex_document([HEX_ROW % row
+                                   for row in zip(self.addrs, self.machine_code, self.sources)])
+    
+    @functools.cached_property
+    def _verilog_text(self) -> str:
+        return self._verilog_document([
+            VERILOG_ROW % (i, code, addr, asm)
+            for i, (addr, code, asm) in enumerate(zip(self.addrs, self.machine_code, self.sources))
+        ])
+    
+    @functools.cached_property
+    def _mem_text(self) -> str:
+        return '\n'.join([MEM_ROW % code for code in self.machine_code])
+    
+    def _hex_document(self, rows: List[str]) -> str:
+        header = (
+            "// RISC-V Machine Code - Generated by riscv_assembler.py",
+            f"// Total instructions: {len(self.machine_code)}",
+            "// Format: ADDRESS: MACHINE_CODE  // ASM",
+            "",
+        )
+        return '\n'.join([*header, *rows])
+    
+    def _verilog_document(self, rows: List[str]) -> str:
+        header = (
+            "// =============================================================================",
+            "// RISC-V Instruction Memory - Auto-generated by riscv_assembler.py",
+            "// =============================================================================",
+            "",
+            "    initial begin",
+        )
+        nops = range(len(self.machine_code), min(len(self.machine_code) + 5, 64))
+        nop_rows = ["        I_MEM_BLOCK[%d] = 32'h00000013;  // nop" % i for i in nops]
+        
+        return '\n'.join([*header, *rows,
+                          "", "        // Fill remaining with NOPs", *nop_rows,
+                          "    end"])
     
     def print_listing(self):
         """Print assembly listing"""
@@ -531,8 +609,9 @@ class RISCVAssembler:
         print(f"{'ADDR':<10} {'MACHINE CODE':<14} {'ASSEMBLY':<30}")
         print("-" * 70)
         
-        for code, (addr, asm, line_num) in zip(self.machine_code, self.instructions):
-            print(f"0x{addr:04X}     0x{code:08X}     {asm}")
+        if self.machine_code:
+            print('\n'.join([LISTING_ROW % row
+                             for row in zip(self.addrs, self.machine_code, self.sources)]))
         
         print("-" * 70)
         print(f"Total: {len(self.machine_code)} instructions ({len(self.machine_code) * 4} bytes)")
@@ -540,11 +619,76 @@ class RISCVAssembler:
         
         if self.labels:
             print("\nLABELS:")
-            for label, addr in self.labels.items():
+            for label, addr in sorted(self.labels.items(), key=lambda kv: kv[1]):
                 print(f"  {label}: 0x{addr:04X}")
 
 
+# Mnemonic -> format handler; each RISCVAssembler binds these into _handlers
+_ENCODERS = {
+    # Pseudo-instructions (nop, halt and ecall are in CONST_ENCODING)
+    'li': RISCVAssembler._li,
+    'mv': RISCVAssembler._mv,
+    'j': RISCVAssembler._j,
+    
+    **dict.fromkeys(('add', 'sub', 'and', 'or', 'xor', 'sll', 'srl', 'sra', 'slt', 'sltu'),
+                    RISCVAssembler._r_type),
+    **dict.fromkeys(('addi', 'andi', 'ori', 'xori', 'slti', 'sltiu'), RISCVAssembler._i_alu),
+    **dict.fromkeys(('slli', 'srli', 'srai'), RISCVAssembler._i_shift),
+    **dict.fromkeys(('lw', 'lh', 'lb', 'lhu', 'lbu'), RISCVAssembler._load),
+    **dict.fromkeys(('sw', 'sh', 'sb'), RISCVAssembler._store),
+    **dict.fromkeys(('beq', 'bne', 'blt', 'bge', 'bltu', 'bgeu'), RISCVAssembler._branch),
+    'jal': RISCVAssembler._jal,
+    'jalr': RISCVAssembler._jalr,
+    'lui': RISCVAssembler._u_type,
+    'auipc': RISCVAssembler._u_type,
+    'rng': RISCVAssembler._rng,
+    'rotl': RISCVAssembler._rotate,
+    'rotr': RISCVAssembler._rotate,
+}
+
+# Mnemonics whose encoding depends on labels or the current address: every
+# mnemonic routed to a handler that resolves its target via target_offset()
+PC_RELATIVE = frozenset(
+    instr for instr, handler in _ENCODERS.items()
+    if handler in (RISCVAssembler._branch, RISCVAssembler._jal, RISCVAssembler._j)
+)
+
+# Mnemonic -> index into RISCVAssembler._handlers; resolved once per line by tokenize()
+MNEMONIC_ID = {instr: mid for mid, instr in enumerate(_ENCODERS)}
+
+# Scratch instance for encode_line(); only used for lines that need no labels
+_LINE_ENCODER = RISCVAssembler()
+
+
+@functools.lru_cache(maxsize=4096)
+def tokenize(text: str) -> Tuple[Optional[int], Tuple[str, ...]]:
+    """Split an instruction line -> (mnemonic id, (mnemonic, operands...))
+
+    The mnemonic is lowercased, interned and looked up in MNEMONIC_ID here,
+    once per distinct line. The id is None for fixed encodings (nop, halt,
+    ecall) and unknown mnemonics.
+    """
+    mnemonic, *operands = text.replace(',', ' ').split()
+    mnemonic = sys.intern(mnemonic.lower())
+    return MNEMONIC_ID.get(mnemonic), (mnemonic, *operands)
+
+
+@functools.lru_cache(maxsize=4096)
+def encode_line(text: str) -> Tuple[int, bool]:
+    """Encode a single instruction line -> (machine_code, is_pc_relative)
+
+    PC-relative lines (branches, jal, j) depend on labels and the current
+    address, so they return (0, True) and must be encoded by the caller.
+    """
+    mid, parts = tokenize(text)
+    if parts[0] in PC_RELATIVE:
+        return 0, True
+    return _LINE_ENCODER.encode_tokens(mid, parts, 0), False
+
+
 def main():
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description='RISC-V Assembler for Single Cycle Processor',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -575,6 +719,9 @@ Examples:
     # Assemble
     asm = RISCVAssembler()
     asm.assemble(source)
+    if asm.errors:
+        asm.print_errors()
+        sys.exit(1)
     
     # Print listing if requested
     if args.listing:
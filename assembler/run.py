@@ -19,7 +19,85 @@ This will:
 import sys
 import os
 import shutil
-from riscv_assembler import RISCVAssembler
+import hashlib
+import locale
+import pickle
+import tempfile
+from pathlib import Path
+import riscv_assembler
+from riscv_assembler import RISCVAssembler, VERILOG_ROW
+
+# Assembled programs from earlier runs, keyed by source hash
+CACHE_DIR = Path('~/.cache/riscv_asm').expanduser()
+CACHE_VERSION = 1  # bump whenever the pickled layout changes
+CACHED_FIELDS = ('labels', 'addrs', 'machine_code', 'sources', 'linenos')
+
+
+def cache_path(source):
+    """Cache file for source
+
+    The cache format and the mtimes of the assembler and this script are
+    hashed in too, so changing any of them invalidates old entries.
+    """
+    key = hashlib.sha256(f"v{CACHE_VERSION} {' '.join(CACHED_FIELDS)}\n".encode())
+    for module in (riscv_assembler.__file__, __file__):
+        key.update(f"{os.stat(module).st_mtime_ns}\n".encode())
+    key.update(source.encode())
+    return CACHE_DIR / (key.hexdigest() + '.pkl')
+
+
+def load_cached(path):
+    """Return an assembler restored from path, or None on a miss or unusable entry"""
+    try:
+        with open(path, 'rb') as f:
+            state = pickle.load(f)
+    except Exception:
+        # Missing, truncated or corrupt: rebuild and overwrite it
+        return None
+    if not isinstance(state, dict) or state.keys() != set(CACHED_FIELDS):
+        return None
+    asm = RISCVAssembler()
+    asm.__dict__.update(state)
+    return asm
+
+
+def store_cached(path, asm):
+    """Save an error-free build; a read-only cache dir just disables caching"""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Written aside and renamed into place so readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump({name: getattr(asm, name) for name in CACHED_FIELDS}, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        pass
+
+
+def write_output(path, text):
+    """Write text to path as one prebuilt bytes buffer
+
+    Encoding and line endings match what text-mode open() would produce,
+    so the files are the same as before on every platform (CRLF on Windows).
+    """
+    if os.linesep != '\n':
+        text = text.replace('\n', os.linesep)
+    data = memoryview(text.encode(locale.getpreferredencoding(False)))
+    
+    # O_BINARY (Windows only) stops the CRT adding a second CR to each line;
+    # 0o666 leaves the permissions to the umask, as open() does
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    fd = os.open(path, flags, 0o666)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
 
 def main():
     if len(sys.argv) < 2:
@@ -46,29 +124,33 @@ def main():
     print(f"Input: {input_file}")
     print()
     
-    # Assemble
-    asm = RISCVAssembler()
-    asm.assemble(source)
+    # Assemble, unless this exact source was built before
+    path = cache_path(source)
+    asm = load_cached(path)
+    if asm is None:
+        asm = RISCVAssembler()
+        asm.assemble(source)
+        if asm.errors:
+            asm.print_errors()
+            sys.exit(1)
+        store_cached(path, asm)
     
     # Print listing
     asm.print_listing()
     
     # Generate outputs
+    hex_text, mem_text, verilog_init = asm.emit_all()
     hex_file = input_file.replace('.asm', '.hex')
-    with open(hex_file, 'w') as f:
-        f.write(asm.to_hex())
+    write_output(hex_file, hex_text)
     print(f"\nHex file written to: {hex_file}")
     
     mem_file = input_file.replace('.asm', '.mem')
-    with open(mem_file, 'w') as f:
-        f.write(asm.to_mem())
+    write_output(mem_file, mem_text)
     print(f"Mem file written to: {mem_file}")
     
     # Generate Verilog initialization
-    verilog_init = asm.to_verilog()
     verilog_file = input_file.replace('.asm', '_verilog_init.v')
-    with open(verilog_file, 'w') as f:
-        f.write(verilog_init)
+    write_output(verilog_file, verilog_init)
     print(f"Verilog init written to: {verilog_file}")
     
     # Optionally update Instruction_Memory.v
@@ -88,14 +170,15 @@ def main():
             import re
             pattern = r'(initial begin\s*\n)(.*?)(^\s*end\s*$)'
             
-            new_init = "initial begin\n"
-            for i, (code, (addr, instr, _)) in enumerate(zip(asm.machine_code, asm.instructions)):
-                new_init += f"        I_MEM_BLOCK[{i}]  = 32'h{code:08X};  // 0x{addr:02X}: {instr}\n"
+            parts = ["initial begin\n"]
+            parts.extend(VERILOG_ROW % (i, code, addr, instr) + "\n"
+                         for i, (addr, code, instr) in enumerate(zip(asm.addrs, asm.machine_code, asm.sources)))
             
             # Add NOPs
-            new_init += "\n        // Fill remaining with NOPs\n"
-            for i in range(len(asm.machine_code), min(len(asm.machine_code) + 5, 64)):
-                new_init += f"        I_MEM_BLOCK[{i}] = 32'h00000013;\n"
+            parts.append("\n        // Fill remaining with NOPs\n")
+            parts.extend(f"        I_MEM_BLOCK[{i}] = 32'h00000013;\n"
+                         for i in range(len(asm.machine_code), min(len(asm.machine_code) + 5, 64)))
+            new_init = "".join(parts)
             
             # Note: Manual replacement might be needed for complex cases
             print("\n" + "=" * 70)